@@ -1,44 +1,181 @@
 import os
-import random
+import sys
+import csv
+import hmac
+import math
+import mmap
+import struct
+import secrets
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 # Constants
-ACCOUNTS_FILE = 'accounts.txt'
-
-def hash_password(password):
+ACCOUNTS_FILE = 'accounts.bin'
+LEGACY_ACCOUNTS_FILE = 'accounts.txt'  # CSV format used before accounts.bin
+JOURNAL_FILE = 'accounts.journal'
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB buffer for accounts file and journal I/O
+COMPACT_INTERVAL = 1000  # Journal records written before the accounts file is rewritten
+JOURNAL_SEED = bytes(32)  # Starting value of the journal's SHA-256 corruption-check chain
+ACCOUNT_TYPES = ('savings', 'current')  # Stored in records by index
+FILE_MAGIC = b'CAP2'
+FILE_VERSION = 3
+FILE_HEADER = struct.Struct('<4sI')  # Magic, format version
+# Account number, password hash, salt, account type index, padding, balance in cents (64 bytes)
+ACCOUNT_RECORD = struct.Struct('<I32s16sB3xq')
+RECORD_PREFIX = struct.Struct('<I32s16sB3x')  # The fields of ACCOUNT_RECORD that never change
+RECORD_BALANCE = struct.Struct('<q')  # The balance field of ACCOUNT_RECORD
+# Version 1 records: account number, SHA-256 digest, account type index, padding, float balance
+V1_ACCOUNT_RECORD = struct.Struct('<I32sB3xd')
+# Version 2 records: as version 3, but with a float balance
+V2_ACCOUNT_RECORD = struct.Struct('<I32s16sB3xd')
+PBKDF2_ITERATIONS = 50_000
+SALT_SIZE = 16
+LEGACY_SALT = bytes(SALT_SIZE)  # Marks an unsalted SHA-256 digest from an older accounts file
+
+def hash_password(password, salt):
     """
-    Hashes a password using SHA-256.
+    Hashes a password using PBKDF2-HMAC-SHA256.
 
     Parameters:
     password (str): The password to hash.
+    salt (bytes): The account's random salt.
+
+    Returns:
+    bytes: The raw 32-byte derived key.
+    """
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, PBKDF2_ITERATIONS)
+
+def parse_amount(text):
+    """
+    Converts a user-entered amount of money to whole cents.
+
+    Parameters:
+    text (str): The amount as typed, e.g. "12.50".
+
+    Returns:
+    int: The amount in cents, or None if the text is not a finite number.
+    """
+    try:
+        amount = float(text)
+    except ValueError:
+        return None
+    return round(amount * 100) if math.isfinite(amount) else None
+
+def format_amount(cents):
+    """
+    Formats an amount of money for display.
+
+    Parameters:
+    cents (int): The amount in cents.
 
     Returns:
-    str: The hashed password.
+    str: The amount with two decimal places.
+    """
+    return f"{cents / 100:.2f}"
+
+def parse_account_number(text):
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    Converts a user-entered account number to the integer key used for accounts.
+
+    Parameters:
+    text (str): The account number as typed.
+
+    Returns:
+    int: The account number, or None if the text is not a number.
+    """
+    text = text.strip()
+    return int(text) if text.isdecimal() else None
 
 class Account:
-    def __init__(self, account_number, password, account_type, balance=0.0):
+    # Fixed attribute slots instead of a per-instance __dict__ keep each account compact
+    __slots__ = ('account_number', 'password', 'salt', 'account_type', 'balance', '_record_prefix')
+
+    def __init__(self, account_number, password, account_type, balance=0):
         """
         Initializes an account.
 
         Parameters:
-        account_number (str): The account number.
+        account_number (int): The account number.
         password (str): The plain text password.
         account_type (str): The type of the account (savings/current).
-        balance (float): The initial balance (default is 0.0).
+        balance (int): The initial balance in cents (default is 0).
         """
         self.account_number = account_number
-        self.password = hash_password(password)  # Store the hashed password
         self.account_type = account_type
         self.balance = balance
+        self.set_password(password)  # Store the hashed password
+
+    @classmethod
+    def _from_stored(cls, account_number, password_hash, salt, account_type, balance):
+        """
+        Creates an account from a record whose password is already hashed.
+
+        Parameters:
+        account_number (int): The account number.
+        password_hash (bytes): The stored 32-byte password hash.
+        salt (bytes): The stored salt, or LEGACY_SALT for an unsalted SHA-256 digest.
+        account_type (str): The type of the account (savings/current).
+        balance (int): The stored balance in cents.
+
+        Returns:
+        Account: The account, without re-hashing the password.
+        """
+        account = cls.__new__(cls)
+        account.account_number = account_number
+        account.password = password_hash
+        account.salt = salt
+        account.account_type = account_type
+        account.balance = balance
+        account._record_prefix = account._pack_prefix()
+        return account
+
+    def _pack_prefix(self):
+        """
+        Packs the fields of the account's file record that never change, so
+        saving only has to pack the balance.
+
+        Returns:
+        bytes: The leading RECORD_PREFIX part of the account's record.
+        """
+        return RECORD_PREFIX.pack(self.account_number, self.password, self.salt,
+                                  ACCOUNT_TYPES.index(self.account_type))
+
+    def set_password(self, password):
+        """
+        Hashes and stores a new password under a fresh random salt.
+
+        Parameters:
+        password (str): The plain text password.
+        """
+        self.salt = secrets.token_bytes(SALT_SIZE)
+        self.password = hash_password(password, self.salt)
+        self._record_prefix = self._pack_prefix()
+
+    def check_password(self, password):
+        """
+        Checks a password against the stored hash.
+
+        Parameters:
+        password (str): The plain text password.
+
+        Returns:
+        bool: True if the password matches.
+        """
+        if self.salt == LEGACY_SALT:
+            # Spend a PBKDF2 run as other checks do, so timing does not single out legacy accounts
+            hash_password(password, LEGACY_SALT)
+            candidate = hashlib.sha256(password.encode()).digest()
+        else:
+            candidate = hash_password(password, self.salt)
+        # Compare in constant time, so timing does not leak how much of the hash matched
+        return hmac.compare_digest(self.password, candidate)
 
     def deposit(self, amount):
         """
         Deposits money into the account.
 
         Parameters:
-        amount (float): The amount to deposit.
+        amount (int): The amount to deposit, in cents.
         """
         self.balance += amount
 
@@ -47,7 +184,7 @@ class Account:
         Withdraws money from the account if sufficient balance exists.
 
         Parameters:
-        amount (float): The amount to withdraw.
+        amount (int): The amount to withdraw, in cents.
 
         Returns:
         bool: True if the withdrawal was successful, False if insufficient funds.
@@ -58,42 +195,206 @@ class Account:
         else:
             return False
 
-    def to_string(self):
+    def to_record(self):
         """
-        Converts the account details to a string format suitable for file storage.
+        Packs the account details into a fixed-width binary record for file storage.
 
         Returns:
-        str: The account details as a string.
+        bytes: The account details as an ACCOUNT_RECORD.
         """
-        return f"{self.account_number},{self.password},{self.account_type},{self.balance}\n"
+        return self._record_prefix + RECORD_BALANCE.pack(self.balance)
+
+def migrate_legacy_accounts(csv_path=LEGACY_ACCOUNTS_FILE, bin_path=ACCOUNTS_FILE):
+    """
+    Converts a CSV accounts file into the binary accounts format.
+    The CSV file is left in place. Account types other than ACCOUNT_TYPES are
+    migrated as savings accounts, and rows that cannot be parsed are skipped;
+    both are reported.
+
+    Parameters:
+    csv_path (str): The CSV accounts file to read.
+    bin_path (str): The binary accounts file to write.
+    """
+    records = [FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION)]
+    with open(csv_path, 'r', buffering=IO_BUFFER_SIZE, newline='') as f:
+        for line_number, row in enumerate(csv.reader(f), start=1):
+            try:
+                account_number, password, account_type, balance = row
+                account_number = int(account_number)
+                password_hash = bytes.fromhex(password)
+                if len(password_hash) != hashlib.sha256().digest_size:
+                    raise ValueError("not a SHA-256 digest")
+                balance = round(float(balance) * 100)
+                account_type = account_type.strip().lower()
+                if account_type not in ACCOUNT_TYPES:
+                    print(f"Account {account_number} has unknown type '{account_type}'; "
+                          f"migrated as {ACCOUNT_TYPES[0]}.")
+                    account_type = ACCOUNT_TYPES[0]
+                account = Account._from_stored(account_number, password_hash, LEGACY_SALT,
+                                               account_type, balance)
+                # Packing rejects account numbers outside the record's uint32 field
+                records.append(account.to_record())
+            except (ValueError, OverflowError, struct.error):  # OverflowError: balance of inf
+                print(f"Skipped unreadable row {line_number} of {csv_path}.")
+    with open(bin_path, 'wb') as f:
+        f.write(b''.join(records))
 
 class BankingApp:
     def __init__(self):
         """
-        Initializes the banking application by loading existing accounts from file.
+        Initializes the banking application by loading existing accounts from file
+        and opening the transaction journal for appending.
         """
-        self.accounts = {}  # Dictionary to store accounts with account number as key
-        self.load_accounts()
+        self.accounts = {}  # Dictionary to store accounts with the integer account number as key
+        self.load_accounts()  # Also counts the journal records it replays in _journal_records
+        self._journal = open(JOURNAL_FILE, 'ab', buffering=IO_BUFFER_SIZE)
+        if self._journal_records >= COMPACT_INTERVAL:
+            self.save_accounts()
 
     def load_accounts(self):
         """
-        Loads accounts from the accounts file.
+        Loads accounts from the accounts file, then replays the journal on top.
+
+        Each journaled transaction ends in an "H" record holding the running hash
+        H = SHA-256(H || records), so the journal is checked for corruption in the
+        same pass that replays it. The hash is unkeyed and its head is not stored
+        elsewhere, so it does not detect deliberate edits or whole transactions
+        removed from the end. A trailing transaction without its "H" record was cut off by a
+        crash; it is discarded and trimmed from the file. A journal with no "H"
+        records at all predates the hash chain; it is replayed as is and folded
+        into the accounts file.
         """
+        if not os.path.exists(ACCOUNTS_FILE) and os.path.exists(LEGACY_ACCOUNTS_FILE):
+            migrate_legacy_accounts()  # One-shot upgrade from the CSV format
         if os.path.exists(ACCOUNTS_FILE):  # Check if accounts file exists
-            with open(ACCOUNTS_FILE, 'r') as f:  # Open the file in read mode
+            if os.path.getsize(ACCOUNTS_FILE) < FILE_HEADER.size:  # Too short to map or hold a header
+                raise ValueError(f"{ACCOUNTS_FILE} is not a supported accounts file.")
+            # Map the file instead of reading it, so records are decoded straight from the page cache
+            with open(ACCOUNTS_FILE, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as data:
+                self._load_snapshot(data)
+        self._state_hash = JOURNAL_SEED
+        self._journal_records = 0  # Records in the journal since the last compaction
+        if os.path.exists(JOURNAL_FILE):  # Apply balance updates made since the last save
+            pending = []  # Records of the transaction being replayed
+            committed_size = 0  # Journal bytes up to the end of the last verified transaction
+            with open(JOURNAL_FILE, 'rb', buffering=IO_BUFFER_SIZE) as f:
                 for line in f:
-                    account_number, password, account_type, balance = line.strip().split(',')
-                    # Create Account object and store it in the accounts dictionary
-                    self.accounts[account_number] = Account(
-                        account_number, password, account_type, float(balance))
+                    # A final line without its newline was cut off mid-write; it stays pending
+                    if not (line.startswith(b'H,') and line.endswith(b'\n')):
+                        pending.append(line)
+                        continue
+                    self._state_hash = hashlib.sha256(self._state_hash + b''.join(pending)).digest()
+                    if not hmac.compare_digest(line[2:].rstrip(), self._state_hash.hex().encode()):
+                        raise ValueError(f"{JOURNAL_FILE} failed its integrity check.")
+                    self._apply_journal_records(pending)
+                    pending = []
+                    committed_size = f.tell()
+                journal_size = f.tell()
+            if committed_size == 0 and pending:
+                # No "H" records: a journal from before hash chaining. Replay its complete
+                # lines, then fold them into the accounts file so new records chain cleanly.
+                self._apply_journal_records([line for line in pending if line.endswith(b'\n')])
+                self._write_accounts_file()
+                os.truncate(JOURNAL_FILE, 0)
+                self._journal_records = 0
+            elif committed_size < journal_size:
+                print(f"Discarded an incomplete transaction at the end of {JOURNAL_FILE}.")
+                os.truncate(JOURNAL_FILE, committed_size)
+
+    def _apply_journal_records(self, records):
+        """
+        Applies journaled balance updates to the loaded accounts.
+
+        Parameters:
+        records (list): The "U" record lines to apply, as bytes.
+        """
+        for record in records:
+            _, account_number, balance = record.strip().split(b',')
+            account_number = int(account_number)
+            if b'.' in balance or b'e' in balance:
+                balance = round(float(balance) * 100)  # Float balance from an older journal
+            if account_number in self.accounts:
+                self.accounts[account_number].balance = int(balance)
+        self._journal_records += len(records)
+
+    def _load_snapshot(self, data):
+        """
+        Rebuilds the accounts dictionary from the contents of the accounts file.
+
+        Parameters:
+        data (memoryview): The accounts file, header included.
+        """
+        magic, version = FILE_HEADER.unpack_from(data)
+        if magic != FILE_MAGIC or version not in (1, 2, FILE_VERSION):
+            raise ValueError(f"{ACCOUNTS_FILE} is not a supported accounts file.")
+        # Release the slice on every exit, so the mapping can be closed even if decoding fails
+        with data[FILE_HEADER.size:] as body:
+            # iter_unpack decodes the fixed-width records in C, with no text parsing
+            if version == 1:  # Unsalted SHA-256 digests; upgraded on the next login
+                records = ((account_number, password_hash, LEGACY_SALT, type_index, round(balance * 100))
+                           for account_number, password_hash, type_index, balance
+                           in V1_ACCOUNT_RECORD.iter_unpack(body))
+            elif version == 2:  # Float balances; converted to cents
+                records = ((account_number, password_hash, salt, type_index, round(balance * 100))
+                           for account_number, password_hash, salt, type_index, balance
+                           in V2_ACCOUNT_RECORD.iter_unpack(body))
+            else:
+                records = ACCOUNT_RECORD.iter_unpack(body)
+            try:
+                for account_number, password_hash, salt, type_index, balance in records:
+                    # Rebuild the Account from its stored hash and keep it in the accounts dictionary
+                    self.accounts[account_number] = Account._from_stored(
+                        account_number, password_hash, salt, ACCOUNT_TYPES[type_index], balance)
+            finally:
+                del records  # Drop the iterator's hold on body before it is released
 
     def save_accounts(self):
         """
-        Saves all accounts to the accounts file.
+        Saves all accounts to the accounts file and truncates the journal,
+        since every journaled update is now part of the file.
+        """
+        self._write_accounts_file()
+        self._journal.truncate(0)  # Flushes pending records before discarding them
+        self._journal_records = 0
+        self._state_hash = JOURNAL_SEED
+
+    def _write_accounts_file(self):
+        """
+        Writes all accounts to the accounts file, leaving the journal alone.
         """
-        with open(ACCOUNTS_FILE, 'w') as f:  # Open the file in write mode
-            for account in self.accounts.values():
-                f.write(account.to_string())  # Write each account's details to the file
+        records = [FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION)]
+        records.extend([account.to_record() for account in self.accounts.values()])
+        with open(ACCOUNTS_FILE, 'wb') as f:  # Open the file in binary write mode
+            f.write(b''.join(records))  # Serialize every account up front and write once
+
+    def record_balances(self, *accounts):
+        """
+        Appends the current balances of the given accounts to the journal as one
+        transaction, followed by the updated hash chain value.
+        The accounts file is compacted every COMPACT_INTERVAL records.
+
+        Parameters:
+        *accounts (Account): The accounts whose balances changed.
+        """
+        # Bytes %-formatting runs in C
+        records = b''.join([b"U,%d,%d\n" % (account.account_number, account.balance)
+                            for account in accounts])
+        self._state_hash = hashlib.sha256(self._state_hash + records).digest()
+        self._journal.write(records + b"H," + self._state_hash.hex().encode() + b"\n")
+        self._journal.flush()  # One write per transaction, so a transfer lands atomically
+        os.fsync(self._journal.fileno())  # Reach the disk, so an OS crash or power loss keeps it too
+        self._journal_records += len(accounts)
+        if self._journal_records >= COMPACT_INTERVAL:
+            self.save_accounts()
+
+    def close(self):
+        """
+        Compacts the journal into the accounts file and closes it.
+        """
+        self.save_accounts()
+        self._journal.close()
 
     def create_account(self, account_type):
         """
@@ -102,8 +403,12 @@ class BankingApp:
         Parameters:
         account_type (str): The type of the account (savings/current).
         """
-        account_number = str(random.randint(100000, 999999))  # Generate a random account number
-        password = str(random.randint(1000, 9999))  # Generate a random 4-digit password
+        account_type = account_type.strip().lower()
+        if account_type not in ACCOUNT_TYPES:
+            print("Invalid account type.")
+            return
+        account_number = secrets.randbelow(900000) + 100000  # Generate a random 6-digit account number
+        password = str(secrets.randbelow(9000) + 1000)  # Generate a random 4-digit password
         account = Account(account_number, password, account_type)  # Create a new Account object
         self.accounts[account_number] = account  # Add the new account to the accounts dictionary
         self.save_accounts()  # Save all accounts to the file
@@ -114,24 +419,59 @@ class BankingApp:
         Logs in to an account if the account number and password match.
 
         Parameters:
-        account_number (str): The account number.
+        account_number (int): The account number.
         password (str): The password.
 
         Returns:
         Account: The account object if login is successful, None otherwise.
         """
+        account = self.authenticate(account_number, password)
+        if account is not None and account.salt == LEGACY_SALT:
+            account.set_password(password)  # Rehash a legacy SHA-256 digest with PBKDF2
+            self.save_accounts()
+        return account
+
+    def authenticate(self, account_number, password):
+        """
+        Checks an account number and password without changing any state.
+
+        Parameters:
+        account_number (int): The account number.
+        password (str): The password.
+
+        Returns:
+        Account: The account object if the credentials match, None otherwise.
+        """
         if account_number in self.accounts:  # Check if the account number exists
             account = self.accounts[account_number]
-            if account.password == hash_password(password):  # Verify the password
+            if account.check_password(password):  # Verify the password
                 return account  # Return the account object if login is successful
+        else:
+            # Spend the same hashing time, so timing does not reveal which accounts exist
+            hash_password(password, LEGACY_SALT)
         return None
 
+    def authenticate_many(self, credentials, max_workers=None):
+        """
+        Checks several logins concurrently. pbkdf2_hmac releases the GIL while
+        hashing, so the checks run in parallel across cores.
+
+        Parameters:
+        credentials (list): (account_number, password) pairs to check.
+        max_workers (int): The number of worker threads (default is chosen by ThreadPoolExecutor).
+
+        Returns:
+        list: The matching Account, or None, for each pair.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda pair: self.authenticate(*pair), credentials))
+
     def delete_account(self, account_number):
         """
         Deletes an account by account number.
 
         Parameters:
-        account_number (str): The account number to delete.
+        account_number (int): The account number to delete.
 
         Returns:
         bool: True if the account was successfully deleted, False otherwise.
@@ -148,17 +488,19 @@ class BankingApp:
 
         Parameters:
         from_account (Account): The account to transfer money from.
-        to_account_number (str): The account number to transfer money to.
-        amount (float): The amount to transfer.
+        to_account_number (int): The account number to transfer money to.
+        amount (int): The amount to transfer, in cents.
 
         Returns:
         bool: True if the transfer was successful, False otherwise.
         """
-        if to_account_number in self.accounts:  # Check if the recipient account exists
+        if amount <= 0:  # A negative amount would move money out of the recipient's account
+            print("Amount must be positive.")
+        elif to_account_number in self.accounts:  # Check if the recipient account exists
             to_account = self.accounts[to_account_number]
             if from_account.withdraw(amount):  # Withdraw the amount from the sender's account
                 to_account.deposit(amount)  # Deposit the amount into the recipient's account
-                self.save_accounts()  # Save the updated accounts to the file
+                self.record_balances(from_account, to_account)  # Journal both new balances
                 return True
             else:
                 print("Insufficient funds.")
@@ -166,71 +508,234 @@ class BankingApp:
             print("Receiving account does not exist.")
         return False
 
-def main():
+    def batch_withdraw(self, account_numbers, amounts):
+        """
+        Withdraws money from several accounts, journaling all new balances
+        in a single write.
+
+        Parameters:
+        account_numbers (list): The account numbers to withdraw from.
+        amounts (list): The amount to withdraw from each account, in cents.
+
+        Returns:
+        list: One bool per withdrawal, True if it succeeded. Amounts that are
+        not positive always fail.
+        """
+        results = []
+        changed = {}  # Accounts to journal, each once with its final balance
+        for account_number, amount in zip(account_numbers, amounts):
+            account = self.accounts.get(account_number)
+            success = amount > 0 and account is not None and account.withdraw(amount)
+            if success:
+                changed[account_number] = account
+            results.append(success)
+        if changed:
+            self.record_balances(*changed.values())  # One journal flush for the whole batch
+        return results
+
+    def batch_transfer(self, from_account_numbers, to_account_numbers, amounts):
+        """
+        Transfers money between several pairs of accounts, journaling all new
+        balances in a single write.
+
+        Parameters:
+        from_account_numbers (list): The account numbers to transfer money from.
+        to_account_numbers (list): The account numbers to transfer money to.
+        amounts (list): The amount of each transfer, in cents.
+
+        Returns:
+        list: One bool per transfer, True if it succeeded. Amounts that are
+        not positive always fail.
+        """
+        results = []
+        changed = {}  # Accounts to journal, each once with its final balance
+        for from_number, to_number, amount in zip(from_account_numbers, to_account_numbers, amounts):
+            from_account = self.accounts.get(from_number)
+            to_account = self.accounts.get(to_number)
+            success = (amount > 0 and from_account is not None and to_account is not None
+                       and from_account.withdraw(amount))
+            if success:
+                to_account.deposit(amount)
+                changed[from_number] = from_account
+                changed[to_number] = to_account
+            results.append(success)
+        if changed:
+            self.record_balances(*changed.values())  # One journal flush for the whole batch
+        return results
+
+    def total_assets(self):
+        """
+        Computes the total balance held across all accounts.
+
+        Returns:
+        int: The sum of all account balances, in cents.
+        """
+        return sum([account.balance for account in self.accounts.values()])  # Exact integer sum
+
+def deposit_action(app, account, read):
+    """
+    Handles the Deposit menu action.
+
+    Parameters:
+    app (BankingApp): The banking application.
+    account (Account): The logged-in account.
+    read (callable): Reads the next input, given a prompt.
+
+    Returns:
+    bool: True if the session has ended.
+    """
+    amount = parse_amount(read("Enter amount to deposit: "))
+    if amount is None or amount <= 0:
+        print("Invalid amount.")
+        return False
+    account.deposit(amount)  # Deposit money
+    app.record_balances(account)  # Journal the updated balance
+    print(f"Deposited {format_amount(amount)}. New balance: {format_amount(account.balance)}")
+    return False
+
+def withdraw_action(app, account, read):
+    """
+    Handles the Withdraw menu action.
+
+    Parameters:
+    app (BankingApp): The banking application.
+    account (Account): The logged-in account.
+    read (callable): Reads the next input, given a prompt.
+
+    Returns:
+    bool: True if the session has ended.
+    """
+    amount = parse_amount(read("Enter amount to withdraw: "))
+    if amount is None or amount <= 0:
+        print("Invalid amount.")
+        return False
+    if account.withdraw(amount):  # Attempt to withdraw money
+        app.record_balances(account)  # Journal the updated balance
+        print(f"Withdrew {format_amount(amount)}. New balance: {format_amount(account.balance)}")
+    else:
+        print("Insufficient funds.")
+    return False
+
+def transfer_action(app, account, read):
+    """
+    Handles the Transfer menu action.
+
+    Parameters:
+    app (BankingApp): The banking application.
+    account (Account): The logged-in account.
+    read (callable): Reads the next input, given a prompt.
+
+    Returns:
+    bool: True if the session has ended.
+    """
+    to_account_number = parse_account_number(read("Enter recipient account number: "))
+    amount = parse_amount(read("Enter amount to transfer: "))
+    if amount is None or amount <= 0:
+        print("Invalid amount.")
+        return False
+    if app.transfer_money(account, to_account_number, amount):  # Transfer money
+        print(f"Transferred {format_amount(amount)} to {to_account_number}. "
+              f"New balance: {format_amount(account.balance)}")
+    return False
+
+def delete_account_action(app, account, read):
+    """
+    Handles the Delete Account menu action.
+
+    Parameters:
+    app (BankingApp): The banking application.
+    account (Account): The logged-in account.
+    read (callable): Reads the next input, given a prompt.
+
+    Returns:
+    bool: True if the session has ended.
+    """
+    if app.delete_account(account.account_number):  # Delete the account
+        print("Account deleted successfully.")
+        return True
+    print("Failed to delete account.")
+    return False
+
+def logout_action(app, account, read):
+    """
+    Handles the Logout menu action.
+
+    Parameters:
+    app (BankingApp): The banking application.
+    account (Account): The logged-in account.
+    read (callable): Reads the next input, given a prompt.
+
+    Returns:
+    bool: True if the session has ended.
+    """
+    return True
+
+# Logged-in menu choices, dispatched with a single dict lookup per action
+ACCOUNT_ACTIONS = {
+    '1': deposit_action,
+    '2': withdraw_action,
+    '3': transfer_action,
+    '4': delete_account_action,
+    '5': logout_action,
+}
+
+def main(script_path=None):
     """
     Main function to run the banking application.
+
+    Parameters:
+    script_path (str): Optional file of inputs, one per line, to replay instead of
+        prompting interactively (default is None). The whole file is read up front.
     """
+    if script_path is None:
+        read = input
+    else:
+        with open(script_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            commands = iter(f.read().decode().splitlines())
+
+        def read(prompt):
+            command = next(commands, None)
+            if command is None:
+                raise EOFError  # Behave like input() at end of file
+            return command
+
     app = BankingApp()  # Initialize the BankingApp
 
-    while True:
-        print("\n1. Create Account\n2. Login\n3. Exit")
-        choice = input("Choose an option: ")
-
-        if choice == '1':
-            account_type = input("Enter account type (savings/current): ")
-            app.create_account(account_type)  # Create a new account
-
-        elif choice == '2':
-            account_number = input("Enter account number: ")
-            password = input("Enter password: ")
-            account = app.login(account_number, password)  # Attempt to login
-            if account:
-                print(f"Logged in as {account_number}. Balance: {account.balance}")
-
-                while True:
-                    print("\n1. Deposit\n2. Withdraw\n3. Transfer\n4. Delete Account\n5. Logout")
-                    action = input("Choose an action: ")
-
-                    if action == '1':
-                        amount = float(input("Enter amount to deposit: "))
-                        account.deposit(amount)  # Deposit money
-                        app.save_accounts()  # Save the updated account
-                        print(f"Deposited {amount}. New balance: {account.balance}")
-
-                    elif action == '2':
-                        amount = float(input("Enter amount to withdraw: "))
-                        if account.withdraw(amount):  # Attempt to withdraw money
-                            app.save_accounts()  # Save the updated account
-                            print(f"Withdrew {amount}. New balance: {account.balance}")
-                        else:
-                            print("Insufficient funds.")
-
-                    elif action == '3':
-                        to_account_number = input("Enter recipient account number: ")
-                        amount = float(input("Enter amount to transfer: "))
-                        if app.transfer_money(account, to_account_number, amount):  # Transfer money
-                            print(f"Transferred {amount} to {to_account_number}. New balance: {account.balance}")
-
-                    elif action == '4':
-                        if app.delete_account(account.account_number):  # Delete the account
-                            print("Account deleted successfully.")
-                            break
-                        else:
-                            print("Failed to delete account.")
-
-                    elif action == '5':
-                        break  # Logout
-                    else:
-                        print("Invalid choice.")
+    try:
+        while True:
+            print("\n1. Create Account\n2. Login\n3. Exit")
+            choice = read("Choose an option: ")
 
-            else:
-                print("Invalid login credentials.")
+            if choice == '1':
+                account_type = read("Enter account type (savings/current): ")
+                app.create_account(account_type)  # Create a new account
 
-        elif choice == '3':
-            break  # Exit the application
+            elif choice == '2':
+                account_number = parse_account_number(read("Enter account number: "))
+                password = read("Enter password: ")
+                account = app.login(account_number, password)  # Attempt to login
+                if account:
+                    print(f"Logged in as {account_number}. Balance: {format_amount(account.balance)}")
 
-        else:
-            print("Invalid choice.")
+                    while True:
+                        print("\n1. Deposit\n2. Withdraw\n3. Transfer\n4. Delete Account\n5. Logout")
+                        handler = ACCOUNT_ACTIONS.get(read("Choose an action: "))
+                        if handler is None:
+                            print("Invalid choice.")
+                        elif handler(app, account, read):
+                            break  # The session has ended
+
+                else:
+                    print("Invalid login credentials.")
+
+            elif choice == '3':
+                break  # Exit the application
+
+            else:
+                print("Invalid choice.")
+    except EOFError:
+        pass  # Input ran out; exit as if the user chose Exit
+    app.close()  # Compact the journal into the accounts file
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1] if len(sys.argv) > 1 else None)